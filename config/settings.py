@@ -4,33 +4,142 @@ AI News Channel - Configuration Settings
 =============================================================================
 """
 
+from __future__ import annotations
+
+import json
+import logging
 import os
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from datetime import datetime, time, timedelta
+from functools import cached_property, lru_cache
+from typing import NamedTuple
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 
-load_dotenv()
+@lru_cache(maxsize=1)
+def get_env() -> Mapping[str, str]:
+    """Load .env once and return a cached, read-only snapshot of the environment"""
+    # load_dotenv still populates os.environ for libraries that read it directly
+    load_dotenv()
+    return MappingProxyType(dict(os.environ))
+
+_ENV = get_env()
+
+logger = logging.getLogger(__name__)
+
+class FeedSpec(NamedTuple):
+    """A single RSS feed source"""
+    name: str
+    url: str
+    category: str
+    priority: str
+    country: str
+
+_FEEDS_FILE = Path(__file__).with_name("feeds.json")
+
+@lru_cache(maxsize=1)
+def _load_feeds() -> tuple[FeedSpec, ...]:
+    """Load the default RSS feeds from feeds.json on first use"""
+    # FeedSpec(**entry) rejects entries with missing or unknown fields
+    feeds = (FeedSpec(**entry) for entry in json.loads(_FEEDS_FILE.read_bytes()))
+    # Intern the small label vocabularies so equal labels share one object
+    return tuple(
+        feed._replace(
+            category=sys.intern(feed.category),
+            priority=sys.intern(feed.priority),
+            country=sys.intern(feed.country)
+        )
+        for feed in feeds
+    )
+
+DEFAULT_BLOCKED_KEYWORDS: frozenset[str] = frozenset((
+    "adult content", "explicit", "nsfw",
+    # "gambling", "cryptocurrency scam"
+))
+
+DEFAULT_SOCIAL_MEDIA_POST_TIMES: tuple[str, ...] = (
+    "09:00", "13:00", "17:00", "21:00"  # 4 times daily
+)
+
+def _keyword_set(keywords: Iterable[str]) -> frozenset[str]:
+    """Return keywords as a lowercased frozenset"""
+    if isinstance(keywords, str):
+        # A bare string would otherwise become a set of single characters
+        raise TypeError(f"keywords must be an iterable of strings, not str: {keywords!r}")
+    return frozenset(keyword.lower() for keyword in keywords)
+
+def _index_feeds(feeds: Iterable[FeedSpec], attr: str) -> Mapping[str, tuple[FeedSpec, ...]]:
+    """Group feeds by one FeedSpec field, keeping their original order"""
+    groups: dict[str, list[FeedSpec]] = {}
+    for feed in feeds:
+        groups.setdefault(getattr(feed, attr), []).append(feed)
+    return MappingProxyType({key: tuple(group) for key, group in groups.items()})
+
+def _mkdir(path: Path) -> None:
+    """Create a directory, skipping the extra stat os.makedirs does first"""
+    try:
+        path.mkdir()
+    except FileExistsError:
+        if not path.is_dir():
+            raise
+    except FileNotFoundError:
+        # Parent is missing (e.g. a nested BASE_PATH) - build the whole chain
+        path.mkdir(parents=True, exist_ok=True)
 
-@dataclass
+def _parse_time(value: str) -> time:
+    """Parse an "HH:MM" schedule string"""
+    return datetime.strptime(value, "%H:%M").time()
+
+# Directories this process has already created or found in place, keyed by
+# absolute path (resolved once by StorageConfig, never on the hot path)
+_CREATED: set[Path] = set()
+
+def _mkdir_once(path: Path) -> None:
+    """Create an already-resolved directory unless this process already has"""
+    if path in _CREATED:
+        return
+    _mkdir(path)
+    _CREATED.add(path)
+
+# No slots: callers read the env-derived defaults straight off the class
+@dataclass(frozen=True)
 class APIConfig:
     """Configuration for all API keys and external services"""
     
     # LLM APIs - Choose based on budget and quality needs
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")  # FREE tier available
-    GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")  # FREE tier available
+    OPENAI_API_KEY: str = _ENV.get("OPENAI_API_KEY", "")
+    GROQ_API_KEY: str = _ENV.get("GROQ_API_KEY", "")  # FREE tier available
+    GEMINI_API_KEY: str = _ENV.get("GEMINI_API_KEY", "")  # FREE tier available
     
     # News APIs
-    NEWSAPI_KEY: str = os.getenv("NEWSAPI_KEY", "")  # FREE: 1000 requests/day
-    GNEWSAPI_KEY: str = os.getenv("GNEWSAPI_KEY", "")  # FREE: 1000 requests/day
-    SERPER_API_KEY: str = os.getenv("SERPER_API_KEY", "")  # Google search
+    NEWSAPI_KEY: str = _ENV.get("NEWSAPI_KEY", "")  # FREE: 1000 requests/day
+    GNEWSAPI_KEY: str = _ENV.get("GNEWSAPI_KEY", "")  # FREE: 1000 requests/day
+    SERPER_API_KEY: str = _ENV.get("SERPER_API_KEY", "")  # Google search
     
     # AI Services (for future use)
-    ELEVENLABS_API_KEY: str = os.getenv("ELEVENLABS_API_KEY", "")  # Voice
-    DID_API_KEY: str = os.getenv("DID_API_KEY", "")  # AI Avatar
+    ELEVENLABS_API_KEY: str = _ENV.get("ELEVENLABS_API_KEY", "")  # Voice
+    DID_API_KEY: str = _ENV.get("DID_API_KEY", "")  # AI Avatar
 
-@dataclass
+# Models unlocked by each API key, as (key name, ((alias, model), ...))
+_MODELS_BY_KEY: tuple[tuple[str, tuple[tuple[str, str], ...]], ...] = (
+    ("GROQ_API_KEY", (
+        ("groq_llama3", "llama3-8b-8192"),
+        ("groq_mixtral", "mixtral-8x7b-32768"),
+        ("groq_gemma", "gemma-7b-it"),
+    )),
+    ("OPENAI_API_KEY", (
+        ("openai_gpt35", "gpt-3.5-turbo"),
+        ("openai_gpt4", "gpt-4-turbo-preview"),
+    )),
+)
+
+# No slots: cached_property needs an instance __dict__
+@dataclass(frozen=True)
 class LLMConfig:
     """Configuration for Language Models"""
     
@@ -42,147 +151,122 @@ class LLMConfig:
     # Model parameters
     TEMPERATURE: float = 0.1  # Low temperature for factual news
     MAX_TOKENS: int = 4096
+    
+    # Keys deciding which models are available - SystemConfig passes its own
+    api: APIConfig = field(default_factory=APIConfig, repr=False)
 
-    @property
-    def available_models(self) -> Dict[str, str]:
-        """Return available models based on API keys"""
-        models = {}
-        
-        if APIConfig.GROQ_API_KEY:
-            models.update({
-                "groq_llama3": "llama3-8b-8192",
-                "groq_mixtral": "mixtral-8x7b-32768",
-                "groq_gemma": "gemma-7b-it"
-            })
-        
-        if APIConfig.OPENAI_API_KEY:
-            models.update({
-                "openai_gpt35": "gpt-3.5-turbo",
-                "openai_gpt4": "gpt-4-turbo-preview"
-            })
-        
-        return models
+    @cached_property
+    def available_models(self) -> Mapping[str, str]:
+        """Return available models based on API keys (computed once, read-only)"""
+        return MappingProxyType(dict(
+            model
+            for api_key, models in _MODELS_BY_KEY
+            if getattr(self.api, api_key)
+            for model in models
+        ))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NewsSourceConfig:
     """Configuration for news sources and RSS feeds"""
     
-    # RSS Feeds - Completely FREE and reliable
-    RSS_FEEDS: List[Dict] = None
-    
-    def __post_init__(self):
-        if self.RSS_FEEDS is None:
-            self.RSS_FEEDS = [
-                {
-                    "name": "BBC News",
-                    "url": "http://feeds.bbci.co.uk/news/rss.xml",
-                    "category": "general",
-                    "priority": "high",
-                    "country": "international"
-                },
-                {
-                    "name": "CNN International",
-                    "url": "http://rss.cnn.com/rss/edition.rss",
-                    "category": "general",
-                    "priority": "high",
-                    "country": "international"
-                },
-                {
-                    "name": "Reuters Top News",
-                    "url": "https://feeds.reuters.com/reuters/topNews",
-                    "category": "general",
-                    "priority": "high",
-                    "country": "international"
-                },
-                {
-                    "name": "Times of India",
-                    "url": "https://timesofindia.indiatimes.com/rssfeedstopstories.cms",
-                    "category": "general",
-                    "priority": "high",
-                    "country": "india"
-                },
-                {
-                    "name": "The Hindu",
-                    "url": "https://www.thehindu.com/news/national/feeder/default.rss",
-                    "category": "general",
-                    "priority": "medium",
-                    "country": "india"
-                },
-                {
-                    "name": "TechCrunch",
-                    "url": "https://feeds.feedburner.com/TechCrunch/",
-                    "category": "technology",
-                    "priority": "medium",
-                    "country": "international"
-                },
-                {
-                    "name": "Economic Times",
-                    "url": "https://economictimes.indiatimes.com/rssfeedsdefault.cms",
-                    "category": "business",
-                    "priority": "medium",
-                    "country": "india"
-                }
-            ]
+    # RSS Feeds - Completely FREE and reliable, loaded once from feeds.json
+    RSS_FEEDS: tuple[FeedSpec, ...] = field(default_factory=_load_feeds)
     
     # Collection settings
     MAX_ARTICLES_PER_SOURCE: int = 15
     HOURS_LOOKBACK: int = 24
     MIN_ARTICLE_LENGTH: int = 100
     
-    # Content filtering
-    BLOCKED_KEYWORDS: List[str] = None
-    REQUIRED_KEYWORDS: List[str] = None
+    # Content filtering - lowercased frozensets for O(1) membership checks
+    BLOCKED_KEYWORDS: frozenset[str] = DEFAULT_BLOCKED_KEYWORDS
+    REQUIRED_KEYWORDS: frozenset[str] = frozenset()
+    
+    # Read-only feed indexes, so selecting feeds is a lookup instead of a scan
+    by_country: Mapping[str, tuple[FeedSpec, ...]] = field(init=False, repr=False, compare=False)
+    by_category: Mapping[str, tuple[FeedSpec, ...]] = field(init=False, repr=False, compare=False)
+    by_priority: Mapping[str, tuple[FeedSpec, ...]] = field(init=False, repr=False, compare=False)
     
-    def __post_init__(self):
-        if self.BLOCKED_KEYWORDS is None:
-            self.BLOCKED_KEYWORDS = [
-                "adult content", "explicit", "nsfw", 
-                # "gambling", "cryptocurrency scam"
-            ]
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "RSS_FEEDS", tuple(self.RSS_FEEDS))
+        # Normalize once so article filters never re-lowercase keywords
+        object.__setattr__(self, "BLOCKED_KEYWORDS", _keyword_set(self.BLOCKED_KEYWORDS))
+        object.__setattr__(self, "REQUIRED_KEYWORDS", _keyword_set(self.REQUIRED_KEYWORDS))
+        object.__setattr__(self, "by_country", _index_feeds(self.RSS_FEEDS, "country"))
+        object.__setattr__(self, "by_category", _index_feeds(self.RSS_FEEDS, "category"))
+        object.__setattr__(self, "by_priority", _index_feeds(self.RSS_FEEDS, "priority"))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StorageConfig:
     """Configuration for data storage and file management"""
     
-    # Base storage paths
-    BASE_PATH: str = "storage/"
-    ARTICLES_PATH: str = "storage/articles/"
-    REPORTS_PATH: str = "storage/reports/"
-    IMAGES_PATH: str = "storage/images/"
-    VIDEOS_PATH: str = "storage/videos/"
-    SOCIAL_CONTENT_PATH: str = "storage/social_content/"
+    # Base storage path - every other path is derived from it
+    BASE_PATH: str | Path = Path("storage")  # str is converted to Path
+    ARTICLES_PATH: Path = field(init=False)
+    REPORTS_PATH: Path = field(init=False)
+    IMAGES_PATH: Path = field(init=False)
+    VIDEOS_PATH: Path = field(init=False)
+    SOCIAL_CONTENT_PATH: Path = field(init=False)
     
     # File management
     MAX_FILES_PER_FOLDER: int = 1000
     AUTO_CLEANUP_DAYS: int = 30
     BACKUP_ENABLED: bool = True
     
-    def ensure_directories(self):
-        """Create all necessary directories"""
-        import os
-        directories = [
-            self.BASE_PATH, self.ARTICLES_PATH, self.REPORTS_PATH,
+    _all_dirs: tuple[Path, ...] = field(init=False, repr=False, compare=False)
+    _resolved_dirs: tuple[Path, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        base = Path(self.BASE_PATH)
+        object.__setattr__(self, "BASE_PATH", base)
+        object.__setattr__(self, "ARTICLES_PATH", base / "articles")
+        object.__setattr__(self, "REPORTS_PATH", base / "reports")
+        object.__setattr__(self, "IMAGES_PATH", base / "images")
+        object.__setattr__(self, "VIDEOS_PATH", base / "videos")
+        object.__setattr__(self, "SOCIAL_CONTENT_PATH", base / "social_content")
+        # BASE_PATH first, so every leaf below it needs a single mkdir
+        object.__setattr__(self, "_all_dirs", (
+            base, self.ARTICLES_PATH, self.REPORTS_PATH,
             self.IMAGES_PATH, self.VIDEOS_PATH, self.SOCIAL_CONTENT_PATH
-        ]
+        ))
+        # Resolve once here so ensure_directories never pays for realpath
+        resolved = base.resolve()
+        object.__setattr__(self, "_resolved_dirs", (resolved,) + tuple(
+            resolved / d.relative_to(base) for d in self._all_dirs[1:]
+        ))
+    
+    def all_dirs(self) -> tuple[Path, ...]:
+        """Return every storage directory, parents before children"""
+        return self._all_dirs
+    
+    def missing_directories(self) -> tuple[Path, ...]:
+        """Return storage directories that no longer exist on disk.
+        
+        Side effect: missing directories are also dropped from the module-level
+        _CREATED cache, so the next ensure_directories() recreates them.
+        """
+        missing = []
+        for directory, resolved in zip(self._all_dirs, self._resolved_dirs):
+            if not resolved.is_dir():
+                _CREATED.discard(resolved)
+                missing.append(directory)
+        return tuple(missing)
+    
+    def ensure_directories(self) -> None:
+        """Create all necessary directories"""
+        for directory in self._resolved_dirs:
+            _mkdir_once(directory)
         
-        for directory in directories:
-            os.makedirs(directory, exist_ok=True)
-            print(f"📁 Directory ready: {directory}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📁 Directories ready: %s", ", ".join(map(str, self._all_dirs)))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkflowConfig:
     """Configuration for workflow scheduling and execution"""
     
     # Timing settings
     DAILY_RUN_TIME: str = "08:00"  # 8 AM daily news
     BREAKING_NEWS_CHECK_INTERVAL: int = 30  # Minutes
-    SOCIAL_MEDIA_POST_TIMES: List[str] = None
-    
-    def __post_init__(self):
-        if self.SOCIAL_MEDIA_POST_TIMES is None:
-            self.SOCIAL_MEDIA_POST_TIMES = [
-                "09:00", "13:00", "17:00", "21:00"  # 4 times daily
-            ]
+    SOCIAL_MEDIA_POST_TIMES: tuple[str, ...] = DEFAULT_SOCIAL_MEDIA_POST_TIMES
     
     # Quality thresholds
     MIN_ARTICLES_FOR_DAILY_NEWS: int = 10
@@ -193,62 +277,100 @@ class WorkflowConfig:
     DAILY_NEWS_ARTICLE_LIMIT: int = 50
     BREAKING_NEWS_ARTICLE_LIMIT: int = 10
     SOCIAL_MEDIA_POSTS_PER_DAY: int = 10
+    
+    # Parsed schedule, so schedulers never re-run strptime on each tick
+    daily_run_at: time = field(init=False, compare=False)
+    post_times: tuple[time, ...] = field(init=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        if not self.SOCIAL_MEDIA_POST_TIMES:
+            raise ValueError("SOCIAL_MEDIA_POST_TIMES must contain at least one time")
+        object.__setattr__(self, "daily_run_at", _parse_time(self.DAILY_RUN_TIME))
+        object.__setattr__(self, "post_times", tuple(sorted(
+            _parse_time(t) for t in self.SOCIAL_MEDIA_POST_TIMES
+        )))
+    
+    def next_post_time(self, now: datetime) -> datetime:
+        """Return the next social media post after ``now``, rolling over to tomorrow"""
+        index = bisect_right(self.post_times, now.time())
+        if index == len(self.post_times):
+            # Past today's last slot - the next post is tomorrow's first
+            return datetime.combine(now.date() + timedelta(days=1), self.post_times[0],
+                                    tzinfo=now.tzinfo)
+        return datetime.combine(now.date(), self.post_times[index], tzinfo=now.tzinfo)
 
 class SystemConfig:
     """Main system configuration that combines all settings"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.api = APIConfig()
-        self.llm = LLMConfig()
+        self.llm = LLMConfig(api=self.api)
         self.news_sources = NewsSourceConfig()
         self.storage = StorageConfig()
         self.workflow = WorkflowConfig()
         
         # Initialize storage directories
         self.storage.ensure_directories()
-    
-    def validate_setup(self) -> Dict[str, bool]:
-        """Validate system configuration and return status"""
-        status = {
-            "storage_ready": True,
+        
+        # API keys never change after init, so pick the LLM once:
+        # groq (free tier, fast) > openai (paid, high quality) > gemini fallback
+        self._optimal_llm = next(
+            (name for name, key in (("groq", self.api.GROQ_API_KEY),
+                                    ("openai", self.api.OPENAI_API_KEY)) if key),
+            "gemini"
+        )
+        
+        # Status checks that only depend on values fixed at init
+        self._static_status = {
             "llm_configured": bool(self.api.OPENAI_API_KEY or self.api.GROQ_API_KEY),
-            "news_sources_ready": len(self.news_sources.RSS_FEEDS) > 0,
-            "newsapi_available": bool(self.api.NEWSAPI_KEY),
-            "all_directories_exist": True
+            "news_sources_ready": bool(self.news_sources.RSS_FEEDS),
+            "newsapi_available": bool(self.api.NEWSAPI_KEY)
         }
         
-        # Check if directories exist
-        try:
-            self.storage.ensure_directories()
-        except Exception as e:
-            status["storage_ready"] = False
-            status["all_directories_exist"] = False
-            print(f"❌ Storage setup error: {e}")
-        
-        return status
+        # Freeze last: cached results below assume nothing changes after init
+        self._frozen = True
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"SystemConfig is frozen; cannot set {name!r}")
+        super().__setattr__(name, value)
+    
+    def __delattr__(self, name: str) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"SystemConfig is frozen; cannot delete {name!r}")
+        super().__delattr__(name)
+    
+    def validate_setup(self) -> dict[str, bool]:
+        """Validate system configuration and return status"""
+        # Only the storage checks can change after init
+        directories_exist = not self.storage.missing_directories()
+        return {
+            "storage_ready": directories_exist,
+            **self._static_status,
+            "all_directories_exist": directories_exist
+        }
     
     def get_optimal_llm(self) -> str:
         """Return the best available LLM based on API keys"""
-        if self.api.GROQ_API_KEY:
-            return "groq"  # Free tier, fast
-        elif self.api.OPENAI_API_KEY:
-            return "openai"  # Paid but high quality
-        else:
-            return "gemini"  # gemini fallback
-    
-    def print_configuration(self):
-        """Print current configuration status"""
-        print("🔧 AI News Channel Configuration")
-        print("=" * 50)
-        
+        return self._optimal_llm
+    
+    def print_configuration(self) -> None:
+        """Print current configuration status in a single write"""
         status = self.validate_setup()
-        for key, value in status.items():
-            emoji = "✅" if value else "❌"
-            print(f"{emoji} {key.replace('_', ' ').title()}: {value}")
-        
-        print(f"\n🤖 Optimal LLM: {self.get_optimal_llm()}")
-        print(f"📰 News Sources: {len(self.news_sources.RSS_FEEDS)}")
-        print(f"💾 Storage Path: {self.storage.BASE_PATH}")
+        lines = ["🔧 AI News Channel Configuration", "=" * 50]
+        lines.extend(
+            f"{'✅' if value else '❌'} {key.replace('_', ' ').title()}: {value}"
+            for key, value in status.items()
+        )
+        if not status["all_directories_exist"]:
+            missing = ", ".join(map(str, self.storage.missing_directories()))
+            lines.append(f"❌ Storage setup error: missing {missing}")
+        lines.append(f"\n🤖 Optimal LLM: {self.get_optimal_llm()}")
+        lines.append(f"📰 News Sources: {len(self.news_sources.RSS_FEEDS)}")
+        lines.append(f"💾 Storage Path: {self.storage.BASE_PATH}")
+        print("\n".join(lines))
 
-# Create global configuration instance
-config = SystemConfig()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_config() -> SystemConfig:
+    """Return the shared configuration, creating it on first use"""
+    return SystemConfig()
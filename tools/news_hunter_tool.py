@@ -5,3 +5,26 @@ News Hunter Tool - Advanced News Collection System
 This tool is responsible for hunting and gathering news from multiple sources.
 It combines RSS feeds, NewsAPI, and web scraping to collect comprehensive news.
 """
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+
+import requests
+
+from config.settings import FeedSpec
+
+
+async def fetch_all(
+    feeds: Iterable[FeedSpec], timeout: int = 10
+) -> list[requests.Response | BaseException]:
+    """Fetch all RSS feeds concurrently, in the same order as ``feeds``.
+
+    A failing or cancelled feed yields its exception instead of aborting the
+    whole batch, so results may be any ``BaseException``.
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(requests.get, feed.url, timeout=timeout) for feed in feeds),
+        return_exceptions=True,
+    )